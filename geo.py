@@ -0,0 +1,31 @@
+"""Geospatial helpers shared by the retriever and the query cache. This module depends only on NumPy, so the storage layer can compute distances without pulling in the UI utilities or their pandas and LangChain imports."""
+
+from __future__ import annotations
+
+from typing import Any
+import numpy as np
+
+# Mean earth radius, matching geopy's great_circle
+EARTH_RADIUS_KM: float = 6371.009
+
+
+def haversine_km(lats: Any, lons: Any, lat: float, lon: float) -> np.ndarray:
+    """
+    Vectorized haversine distance from a single point to arrays of points.
+
+    :param lats: Latitudes of the points to measure, in degrees
+    :param lons: Longitudes of the points to measure, in degrees
+    :param lat: Latitude of the reference point, in degrees
+    :param lon: Longitude of the reference point, in degrees
+    :return: Distances in kilometers, one per input point
+    :rtype: np.ndarray
+    """
+    lat1 = np.radians(np.asarray(lats, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lons, dtype=np.float64))
+    lat2, lon2 = np.radians(lat), np.radians(lon)
+
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
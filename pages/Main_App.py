@@ -4,24 +4,39 @@ import streamlit as st
 
 import os
 import time
+import asyncio
+import queue
+import threading
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Any, TypedDict, List, Dict
-from pydantic import ConfigDict
-from geopy.distance import great_circle
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+    Optional,
+    TypedDict,
+    List,
+    Dict,
+)
+from pydantic import ConfigDict, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from utilities import utilities
+from geo import haversine_km
 from storage import QueryStorage, QueryRecord
 from tts_system import KokoroTTS
 
 # LangChain Imports
 from langchain_core.retrievers import BaseRetriever
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import StrOutputParser
 from langchain_core.documents import Document
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from sentence_transformers import SentenceTransformer
+if TYPE_CHECKING:
+    import httpx
 
 import logging
 import warnings
@@ -34,6 +49,8 @@ warnings.filterwarnings("ignore", category=UserWarning)
 logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
 logging.getLogger("transformers").setLevel(logging.ERROR)
 
+logger = logging.getLogger(__name__)
+
 
 load_dotenv()
 
@@ -42,9 +59,13 @@ class GoogleMapsPOIRetriever(BaseRetriever):
     user_latitude: float
     user_longitude: float
     maps_api_key: str
-    search_api_key: str
-    cse_id: str
+    # Custom Search is only a fallback for places without an editorial summary
+    search_api_key: Optional[str] = None
+    cse_id: Optional[str] = None
     radius: int = 1500
+    max_search_workers: int = 10
+    # Shared keep-alive session, so each call skips a fresh TCP/TLS handshake
+    session: requests.Session = Field(default_factory=requests.Session)
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     def _get_pois_from_places_new(self, query: str) -> list[Dict[str, Any]]:
@@ -57,7 +78,7 @@ class GoogleMapsPOIRetriever(BaseRetriever):
         headers = {
             "Content-Type": "application/json",
             "X-Goog-Api-Key": self.maps_api_key,
-            "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.location,places.accessibilityOptions",
+            "X-Goog-FieldMask": "places.id,places.displayName,places.formattedAddress,places.location,places.accessibilityOptions,places.editorialSummary",
         }
 
         # We use locationBias to find results near the user
@@ -76,12 +97,14 @@ class GoogleMapsPOIRetriever(BaseRetriever):
         }
 
         try:
-            response = requests.post(url, json=payload, headers=headers, timeout=10)
+            response = self.session.post(
+                url, json=payload, headers=headers, timeout=10
+            )
             if response.status_code != 200:
                 st.error(f"Google API Error ({response.status_code}): {response.text}")
                 return []
 
-            res = response.json()
+            res = orjson.loads(response.content)
             places: dict[str, Any] = res.get("places", [])
 
             # Debugging: Show count in the console/logs
@@ -90,28 +113,165 @@ class GoogleMapsPOIRetriever(BaseRetriever):
             st.error(f"Request Exception: {e}")
             return []
 
-    def _get_search_snippet(self, poi_name: str, vicinity: str) -> str:
+    SEARCH_URL: ClassVar[str] = "https://www.googleapis.com/customsearch/v1"
+    # Cap on in-flight Custom Search requests, bursts above this get 429'd by the quota
+    SEARCH_CONCURRENCY: ClassVar[int] = 5
+    SEARCH_RETRY_STATUSES: ClassVar[frozenset[int]] = frozenset(
+        {429, 500, 502, 503, 504}
+    )
+    SEARCH_SEMAPHORE: ClassVar[threading.Semaphore] = threading.Semaphore(
+        SEARCH_CONCURRENCY
+    )
+
+    def _search_params(self, poi_name: str, vicinity: str) -> dict[str, Any]:
         """
-        Fetch web context using Google Custom Search
+        Build the Custom Search query parameters for a POI
         """
-
-        url = "https://www.googleapis.com/customsearch/v1"
-        params = {
+        return {
             "key": self.search_api_key,
             "cx": self.cse_id,
             "q": f"{poi_name} {vicinity}",
             "num": 1,
         }
+
+    @staticmethod
+    def _parse_search_snippet(res: dict[str, Any]) -> str:
+        """
+        Extract the first result's snippet from a Custom Search response
+        """
+        if "items" in res and len(res["items"]) > 0:
+            return res["items"][0].get("snippet", "No web info found.")
+
+        return "No additional web context found."
+
+    @staticmethod
+    def _describe_search_error(e: Exception) -> str:
+        """
+        Summarise a failed search without its message, which contains the request
+        URL and so the API key. Uses the HTTP status when there is one.
+        """
+        response = getattr(e, "response", None)
+        status = getattr(response, "status_code", None)
+        return f"HTTP {status}" if status is not None else type(e).__name__
+
+    def _get_search_snippet(
+        self, poi_name: str, vicinity: str, errors: Optional[queue.Queue] = None
+    ) -> str:
+        """
+        Fetch web context using Google Custom Search.
+        Retries on 429 and 5xx come from the session's adapter, failures are put on
+        `errors` rather than shown, since this runs on worker threads.
+        """
         try:
-            response = requests.get(url, params=params, timeout=5)
-            res = response.json()
-            if "items" in res and len(res["items"]) > 0:
-                return res["items"][0].get("snippet", "No web info found.")
+            with self.SEARCH_SEMAPHORE:
+                response = self.session.get(
+                    self.SEARCH_URL,
+                    params=self._search_params(poi_name, vicinity),
+                    timeout=5,
+                )
+            response.raise_for_status()
+            return self._parse_search_snippet(orjson.loads(response.content))
 
+        except Exception as e:
+            if errors is not None:
+                errors.put(f"{poi_name}: {self._describe_search_error(e)}")
             return "No additional web context found."
 
+    async def _get_search_snippet_async(
+        self,
+        client: "httpx.AsyncClient",
+        semaphore: asyncio.Semaphore,
+        poi_name: str,
+        vicinity: str,
+        errors: Optional[queue.Queue] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.3,
+    ) -> str:
+        """
+        Fetch web context using Google Custom Search, without blocking the event loop.
+        Retries 429 and 5xx responses, connection errors and timeouts with exponential
+        backoff, matching the Retry policy of the requests session.
+        """
+        import httpx
+
+        try:
+            for attempt in range(retries + 1):
+                try:
+                    async with semaphore:
+                        response = await client.get(
+                            self.SEARCH_URL,
+                            params=self._search_params(poi_name, vicinity),
+                        )
+                except httpx.TransportError:
+                    if attempt == retries:
+                        raise
+                else:
+                    if (
+                        response.status_code not in self.SEARCH_RETRY_STATUSES
+                        or attempt == retries
+                    ):
+                        break
+                await asyncio.sleep(backoff_factor * 2**attempt)
+
+            response.raise_for_status()
+            return self._parse_search_snippet(orjson.loads(response.content))
+
         except Exception as e:
-            return f"Web search error: {str(e)}"
+            if errors is not None:
+                errors.put(f"{poi_name}: {self._describe_search_error(e)}")
+            return "No additional web context found."
+
+    async def _gather_snippets(
+        self, pairs: list[tuple[str, str]], errors: queue.Queue
+    ) -> list[str]:
+        """
+        Fetch all snippets concurrently over one pooled async client, preserving order.
+        The client is bound to the event loop asyncio.run creates for this fan-out, so
+        it can't outlive a single search: each search pays one set of handshakes,
+        shared by all of its snippet requests. On this path the pooled requests session
+        only serves the Places call, SEARCH_SEMAPHORE only applies to the threaded fallback.
+        """
+        import httpx
+
+        semaphore = asyncio.Semaphore(self.SEARCH_CONCURRENCY)
+        limits = httpx.Limits(max_connections=self.SEARCH_CONCURRENCY)
+        async with httpx.AsyncClient(limits=limits, timeout=5) as client:
+            return await asyncio.gather(
+                *[
+                    self._get_search_snippet_async(client, semaphore, *pair, errors)
+                    for pair in pairs
+                ]
+            )
+
+    def _fetch_snippets(self, pairs: list[tuple[str, str]]) -> list[str]:
+        """
+        Fetch web snippets for (name, address) pairs, using asyncio when httpx is
+        installed and a thread pool otherwise. Failed searches are collected on a
+        queue and logged from the calling thread once all snippets are in.
+        """
+        errors: queue.Queue = queue.Queue()
+
+        # Optional async HTTP client, imported here since the fallback search is rare
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            httpx = None
+
+        if httpx is not None:
+            # The Streamlit script thread has no running event loop, so asyncio.run is safe
+            snippets = asyncio.run(self._gather_snippets(pairs, errors))
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_search_workers, len(pairs))
+            ) as executor:
+                snippets = list(
+                    executor.map(lambda p: self._get_search_snippet(*p, errors), pairs)
+                )
+
+        while not errors.empty():
+            logger.warning("Web search error for %s", errors.get())
+
+        return snippets
 
     def _get_relevant_documents(self, query: str) -> list[Document]:
         """
@@ -120,43 +280,83 @@ class GoogleMapsPOIRetriever(BaseRetriever):
 
         places: dict[str, Any] = self._get_pois_from_places_new(query)
         docs: list[Document] = []
-        user_loc: tuple[float, float] = (self.user_latitude, self.user_longitude)
 
+        # Pass 1: Extract the POI fields, skipping places without cordinates
+        candidates: list[dict[str, Any]] = []
         for poi in places:
-            name: str = poi.get("displayName", {}).get("text", "Unknown Place")
-            address: str = poi.get("formattedAddress", "No address available")
-            loc: str = poi.get("location", {})
+            loc: dict[str, Any] = poi.get("location", {})
             p_lat, p_lng = loc.get("latitude"), loc.get("longitude")
+            if not (p_lat and p_lng):
+                continue
 
             acc: dict[dict[str, Any]] = poi.get("accessibilityOptions", {})
-            wheelchair_entrance: bool = acc.get(
-                "wheelchairAccessibleEntrance", "Unknown"
+            candidates.append(
+                {
+                    "name": poi.get("displayName", {}).get("text", "Unknown Place"),
+                    "address": poi.get("formattedAddress", "No address available"),
+                    "latitude": p_lat,
+                    "longitude": p_lng,
+                    "summary": poi.get("editorialSummary", {}).get("text"),
+                    "wheelchair_entrance": acc.get(
+                        "wheelchairAccessibleEntrance", "Unknown"
+                    ),
+                    "wheelchair_restroom": acc.get(
+                        "wheelchairAccessibleRestroom", "Unknown"
+                    ),
+                }
             )
-            wheelchair_restroom: bool = acc.get(
-                "wheelchairAccessibleRestroom", "Unknown"
+
+        if not candidates:
+            return docs
+
+        # Pass 2: Places returns an editorial summary for most POIs in the same
+        # request, only fall back to a web search for the ones without it.
+        snippets: list[str] = [
+            c["summary"] or "No additional web context found." for c in candidates
+        ]
+        missing: list[int] = [i for i, c in enumerate(candidates) if not c["summary"]]
+
+        if missing and self.search_api_key and self.cse_id:
+            # Web searches are I/O bound, so fetch the snippets concurrently
+            fetched = self._fetch_snippets(
+                [(candidates[i]["name"], candidates[i]["address"]) for i in missing]
             )
+            for i, snippet in zip(missing, fetched):
+                snippets[i] = snippet
+
+        # Compute every distance in one vectorized pass
+        distances = haversine_km(
+            [c["latitude"] for c in candidates],
+            [c["longitude"] for c in candidates],
+            self.user_latitude,
+            self.user_longitude,
+        )
 
-            if p_lat and p_lng:
-                dist = f"{great_circle(user_loc, (p_lat, p_lng)).km:.2f}"
-                snippet = self._get_search_snippet(name, address)
-
-                # Combine search snippet with accessibility facts for the LLM
-                content = f"Name: {name}. Distance: {dist}km. {snippet} Accessibility Info - Entrance: {wheelchair_entrance}, Restroom: {wheelchair_restroom}."
-
-                # Compile Contents and Metadata into the Document
-                docs.append(
-                    Document(
-                        page_content=content,
-                        metadata={
-                            "poi_name": name,
-                            "address": address,
-                            "distance_km": dist,
-                            "latitude": p_lat,
-                            "longitude": p_lng,
-                            "wheelchair": (wheelchair_entrance, wheelchair_restroom),
-                        },
-                    )
+        # Pass 3: Combine the snippets with the POI metadata, preserving order
+        for poi, snippet, distance in zip(candidates, snippets, distances):
+            name: str = poi["name"]
+            p_lat, p_lng = poi["latitude"], poi["longitude"]
+            wheelchair_entrance = poi["wheelchair_entrance"]
+            wheelchair_restroom = poi["wheelchair_restroom"]
+            dist = f"{distance:.2f}"
+
+            # Combine search snippet with accessibility facts for the LLM
+            content = f"Name: {name}. Distance: {dist}km. {snippet} Accessibility Info - Entrance: {wheelchair_entrance}, Restroom: {wheelchair_restroom}."
+
+            # Compile Contents and Metadata into the Document
+            docs.append(
+                Document(
+                    page_content=content,
+                    metadata={
+                        "poi_name": name,
+                        "address": poi["address"],
+                        "distance_km": dist,
+                        "latitude": p_lat,
+                        "longitude": p_lng,
+                        "wheelchair": (wheelchair_entrance, wheelchair_restroom),
+                    },
                 )
+            )
         return docs
 
 
@@ -263,27 +463,11 @@ def clear_results() -> None:
     st.session_state.summary = ""
     st.session_state.docs = []
     st.session_state.cache = {}
+    st.session_state.docs_query = ""
+    st.session_state.poi_table = None
 
 
-def get_rag_response(
-    _query: str, _lat: str, _lon: str, _keys: dict[str, str]
-) -> tuple[str, list[Document]]:
-    """
-    Execute RAG chain and cache results
-    """
-    retriever = GoogleMapsPOIRetriever(
-        user_latitude=_lat,
-        user_longitude=_lon,
-        maps_api_key=_keys["GOOGLE_MAPS_API_KEY"],
-        search_api_key=_keys["GOOGLE_SEARCH_API_KEY"],
-        cse_id=_keys["GOOGLE_CSE_ID"],
-    )
-
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-3-flash", google_api_key=_keys["GOOGLE_API_KEY"]
-    )
-
-    audio_prompt_template = """
+AUDIO_PROMPT_TEMPLATE = """
 ROLE:
 You are an expert Audio Description Specialist and Accessibility Consultant. Your goal is to convert technical point-of-interest data into a warm, helpful, and natural-sounding audio briefing for a user with visual or mobility impairments.
 
@@ -310,25 +494,123 @@ CONTEXT DATA:
 AUDIO SCRIPT:
 """
 
-    prompt = PromptTemplate.from_template(audio_prompt_template)
-    docs = retriever.invoke(_query)
+
+# Decimal places kept in the retrieval cache key, 3 decimals is roughly 100m
+CACHE_COORD_DECIMALS: int = 3
+
+
+def retrieval_cache_key(
+    query: str, lat: float, lon: float
+) -> tuple[str, float, float]:
+    """
+    Build the (query, lat, lon) arguments fetch_nearby_documents is cached on.
+    Cordinates are rounded to ~100m so tiny changes share an entry, this is well within
+    the 1.5km search radius so the rounded point is also used for the search.
+    """
+    return (
+        query.strip().lower(),
+        round(lat, CACHE_COORD_DECIMALS),
+        round(lon, CACHE_COORD_DECIMALS),
+    )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def fetch_nearby_documents(
+    query: str, lat: float, lon: float, _keys: dict[str, str]
+) -> list[Document]:
+    """
+    Retrieve POI documents, cached in-process on (query, lat, lon).
+    Sits in front of the Maps and Search APIs, while the SQLite cache stores summaries.
+    """
+    retriever = GoogleMapsPOIRetriever(
+        user_latitude=lat,
+        user_longitude=lon,
+        maps_api_key=_keys["GOOGLE_MAPS_API_KEY"],
+        search_api_key=_keys.get("GOOGLE_SEARCH_API_KEY"),
+        cse_id=_keys.get("GOOGLE_CSE_ID"),
+        session=initialize_http_session(),
+    )
+    return retriever.invoke(query)
+
+
+def build_llm(api_key: str) -> Any:
+    """
+    Create the Gemini chat client.
+    """
+    # Deferred import, the Gemini SDK is only needed once a search misses the cache
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(model="gemini-3-flash", google_api_key=api_key)
+
+
+def get_rag_response(
+    _query: str, _lat: str, _lon: str, _keys: dict[str, str]
+) -> tuple[list[Document], Callable[[], Iterator[str]]]:
+    """
+    Retrieve nearby documents and prepare the summary prompt.
+    Returns the documents and a callable that streams the summary, so the UI can
+    show tokens as they arrive instead of waiting for the full generation.
+    """
+    # Import and build the Gemini client in the background so its setup overlaps
+    # with the Maps and Search requests instead of adding to the critical path.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        llm_future = executor.submit(build_llm, _keys["GOOGLE_API_KEY"])
+        cache_key = retrieval_cache_key(_query, _lat, _lon)
+        docs = fetch_nearby_documents(*cache_key, _keys)
+        llm = llm_future.result()
 
     if not docs:
-        return (
-            "I couldn't find any specific places matching your search in this area.",
-            [],
+        # Don't let an empty or failed lookup stick in the in-process cache
+        fetch_nearby_documents.clear(*cache_key, _keys)
+        return [], lambda: iter(
+            ["I couldn't find any specific places matching your search in this area."]
         )
 
+    return docs, build_summary_stream(llm, docs, _query)
+
+
+def build_summary_stream(
+    llm: Any, docs: list[Document], question: str
+) -> Callable[[], Iterator[str]]:
+    """
+    Format the documents into the audio prompt and return a callable streaming the answer.
+    """
     formatted_context = "\n".join(
         [
             f"{d.metadata['poi_name']} ({d.metadata['distance_km']}km): {d.page_content}"
             for d in docs
         ]
     )
-    chain = prompt | llm | StrOutputParser()
-    summary = chain.invoke({"context": formatted_context, "question": _query})
+    prompt_str = AUDIO_PROMPT_TEMPLATE.format(
+        context=formatted_context, question=question
+    )
+
+    def stream_summary() -> Iterator[str]:
+        for chunk in llm.stream(prompt_str):
+            yield chunk.text
+
+    return stream_summary
 
-    return summary, docs
+
+def answer_followup(
+    question: str, docs: list[Document], api_key: str
+) -> Callable[[], Iterator[str]]:
+    """
+    Answer a follow-up question from the documents already in the session.
+    Skips the cache lookup and the Maps and Search APIs, only the LLM is called.
+    """
+    return build_summary_stream(build_llm(api_key), docs, question)
+
+
+def stream_to_summary(stream_summary: Callable[[], Iterator[str]]) -> str:
+    """
+    Stream tokens into a placeholder, the styled summary box replaces it once done.
+    """
+    stream_placeholder = st.empty()
+    with stream_placeholder.container():
+        summary = st.write_stream(stream_summary())
+    stream_placeholder.empty()
+    return summary
 
 
 def render_accessible_summary_dark(summary_text):
@@ -359,6 +641,45 @@ def render_accessible_summary_dark(summary_text):
     st.markdown(html_content, unsafe_allow_html=True)
 
 
+def render_results() -> None:
+    """
+    Render the results table and the summary from session state.
+    """
+    # Build and style the table once per result set instead of on every rerun,
+    # it is rebuilt only when the docs list itself is replaced
+    cached = st.session_state.get("poi_table")
+    if cached and cached[0] is st.session_state.docs:
+        poi_df = cached[1]
+    else:
+        poi_df = apply_df_styles(utilities.create_df_table(st.session_state.docs))
+        st.session_state.poi_table = (st.session_state.docs, poi_df)
+
+    with st.container(border=True):
+        st.subheader("AI Guide Results")
+        st.dataframe(poi_df, hide_index=True)
+
+    if st.session_state.summary:
+        render_accessible_summary_dark(st.session_state.summary)
+
+
+@st.cache_resource
+def initialize_http_session() -> requests.Session:
+    """Cache a pooled HTTP session so connections to Google APIs are reused across searches."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
 @st.cache_resource
 def initialize_tts() -> KokoroTTS:
     """Cache the TTS model to avoid reinitialization on every audio play."""
@@ -374,6 +695,9 @@ def initialize_storage() -> QueryStorage:
 @st.cache_resource
 def initialize_embedding_model():
     """Cache the lightweight model so it only loads into memory once."""
+    # Deferred import, torch and transformers load on the first search instead of first paint
+    from sentence_transformers import SentenceTransformer
+
     return SentenceTransformer("all-MiniLM-L6-v2")
 
 
@@ -402,6 +726,8 @@ if "last_click_time" not in st.session_state:
     st.session_state.last_click_time = 0
 if "cache" not in st.session_state:
     st.session_state.cache = {}
+if "docs_query" not in st.session_state:
+    st.session_state.docs_query = ""
 
 
 # Main Application
@@ -442,78 +768,115 @@ if st.session_state.auth:
         if is_rate_limit():
             st.stop()
 
-        clear_results()
+        # Follow-up on the current results, answer from the documents already in the session.
+        # Compared against the query that retrieved the docs, so repeated follow-ups keep reusing them.
+        # Moving the cordinates clears the docs, so reuse never crosses locations.
+        is_followup: bool = bool(st.session_state.docs) and utilities.is_followup_query(
+            query, st.session_state.docs_query
+        )
 
-        embedder = initialize_embedding_model()
-        query_vector: List[float] = embedder.encode(query).tolist()
+        if is_followup:
+            try:
+                if not os.environ.get("GOOGLE_API_KEY"):
+                    raise Exception(
+                        "GOOGLE_API_KEY is missing. Please check your environment variables."
+                    )
 
-        # Cache System -- Connect to local storage and check for nearby cached results before running system.
-        connection = initialize_storage()
-        st.session_state.cache = connection.find_nearby_query(
-            query_text=query,
-            user_embedding=query_vector,
-            lat=st.session_state.user_lat,
-            lon=st.session_state.user_lon,
-            similarity_threshold=0.80,
-        )
-        cache_result = st.session_state.cache
-
-        if cache_result:
-            st.session_state.summary = cache_result.summary or "No summary available."
-            table_data: list[dict[str, Any]] = cache_result.table_data or []
-            reconstruct_docs: list[Document] = []
-            for record in table_data:
-                reconstruct_docs.append(
-                    Document(
-                        page_content="",
-                        metadata={
-                            "poi_name": record.get("poi_name"),
-                            "address": record.get("address"),
-                            "distance_km": record.get("distance_km"),
-                            "latitude": record.get("latitude"),
-                            "longitude": record.get("longitude"),
-                            "wheelchair": record.get("wheelchair"),
-                        },
+                st.session_state.summary = stream_to_summary(
+                    answer_followup(
+                        query, st.session_state.docs, os.environ["GOOGLE_API_KEY"]
                     )
                 )
-            st.session_state.docs = reconstruct_docs
-            st.success("Loaded results from cache!")
-        else:
-            # If no cache, run the RAG chain and save results
-            # Implementing a simple rate limit to prevent spamming the API while testing
+                st.session_state.cache = {}
+                st.success("Answered from the current results.")
 
-            keys: dict[str, str] = {
-                "GOOGLE_API_KEY": os.environ.get("GOOGLE_API_KEY"),
-                "GOOGLE_MAPS_API_KEY": os.environ.get("GOOGLE_MAPS_API_KEY"),
-                "GOOGLE_SEARCH_API_KEY": os.environ.get("GOOGLE_SEARCH_API_KEY"),
-                "GOOGLE_CSE_ID": os.environ.get("GOOGLE_CSE_ID"),
-            }
+            except Exception as e:
+                st.error(f"Error: {e}")
 
-            try:
-                if not all(keys.values()):
-                    raise Exception(
-                        "One or more API keys are missing. Please check your environment variables."
+        else:
+            clear_results()
+
+            embedder = initialize_embedding_model()
+            query_vector: List[float] = embedder.encode(query).tolist()
+
+            # Cache System -- Connect to local storage and check for nearby cached results before running system.
+            connection = initialize_storage()
+            st.session_state.cache = connection.find_nearby_query(
+                query_text=query,
+                user_embedding=query_vector,
+                lat=st.session_state.user_lat,
+                lon=st.session_state.user_lon,
+                similarity_threshold=0.80,
+            )
+            cache_result = st.session_state.cache
+
+            if cache_result:
+                st.session_state.summary = cache_result.summary or "No summary available."
+                table_data: list[dict[str, Any]] = cache_result.table_data or []
+                reconstruct_docs: list[Document] = []
+                for record in table_data:
+                    # Rebuild the accessibility facts, so follow-ups on cached results still see them
+                    wheelchair = record.get("wheelchair")
+                    if isinstance(wheelchair, (tuple, list)) and len(wheelchair) == 2:
+                        entrance, restroom = wheelchair
+                    else:
+                        entrance, restroom = ("Unknown", "Unknown")
+                    reconstruct_docs.append(
+                        Document(
+                            page_content=f"Name: {record.get('poi_name')}. Distance: {record.get('distance_km')}km. Accessibility Info - Entrance: {entrance}, Restroom: {restroom}.",
+                            metadata={
+                                "poi_name": record.get("poi_name"),
+                                "address": record.get("address"),
+                                "distance_km": record.get("distance_km"),
+                                "latitude": record.get("latitude"),
+                                "longitude": record.get("longitude"),
+                                "wheelchair": record.get("wheelchair"),
+                            },
+                        )
                     )
+                st.session_state.docs = reconstruct_docs
+                st.session_state.docs_query = query
+                st.success("Loaded results from cache!")
+            else:
+                # If no cache, run the RAG chain and save results
+                # Implementing a simple rate limit to prevent spamming the API while testing
+
+                keys: dict[str, str] = {
+                    "GOOGLE_API_KEY": os.environ.get("GOOGLE_API_KEY"),
+                    "GOOGLE_MAPS_API_KEY": os.environ.get("GOOGLE_MAPS_API_KEY"),
+                    "GOOGLE_SEARCH_API_KEY": os.environ.get("GOOGLE_SEARCH_API_KEY"),
+                    "GOOGLE_CSE_ID": os.environ.get("GOOGLE_CSE_ID"),
+                }
 
-                st.session_state.summary, st.session_state.docs = get_rag_response(
-                    query, st.session_state.user_lat, st.session_state.user_lon, keys
-                )
+                try:
+                    # The Custom Search keys are optional, they only enrich places without a summary
+                    if not (keys["GOOGLE_API_KEY"] and keys["GOOGLE_MAPS_API_KEY"]):
+                        raise Exception(
+                            "One or more API keys are missing. Please check your environment variables."
+                        )
 
-                # Save to cache
-                df_to_cache = utilities.store_doc_metadata(st.session_state.docs)
-                new_record = QueryRecord(
-                    query=query,
-                    lat=st.session_state.user_lat,
-                    lon=st.session_state.user_lon,
-                    summary=st.session_state.summary,
-                    table_data=df_to_cache.to_dict("records"),
-                    embedding=query_vector,
-                )
+                    st.session_state.docs, stream_summary = get_rag_response(
+                        query, st.session_state.user_lat, st.session_state.user_lon, keys
+                    )
+                    st.session_state.docs_query = query
+
+                    st.session_state.summary = stream_to_summary(stream_summary)
+
+                    # Save to cache
+                    df_to_cache = utilities.store_doc_metadata(st.session_state.docs)
+                    new_record = QueryRecord(
+                        query=query,
+                        lat=st.session_state.user_lat,
+                        lon=st.session_state.user_lon,
+                        summary=st.session_state.summary,
+                        table_data=df_to_cache.to_dict("records"),
+                        embedding=query_vector,
+                    )
 
-                connection.save_query_result(new_record)
+                    connection.save_query_result(new_record)
 
-            except Exception as e:
-                st.error(f"Error: {e}")
+                except Exception as e:
+                    st.error(f"Error: {e}")
 
     if c4.button("Clear Cache") and st.session_state.cache:
         connection = initialize_storage()
@@ -523,6 +886,19 @@ if st.session_state.auth:
             lon=st.session_state.cache.lon,
         )
 
+        # Also drop the in-process documents, for both the cached record and the current search
+        for key in {
+            retrieval_cache_key(
+                st.session_state.cache.query,
+                st.session_state.cache.lat,
+                st.session_state.cache.lon,
+            ),
+            retrieval_cache_key(
+                query, st.session_state.user_lat, st.session_state.user_lon
+            ),
+        }:
+            fetch_nearby_documents.clear(*key, None)
+
         clear_results()
         st.success("Cache cleared for this query and location.")
 
@@ -535,16 +911,8 @@ if st.session_state.auth:
 
     c5_button = c5.button("Play Audio Summary")
 
-    # Apply styles to DataFrame and display results
-    poi_df: pd.DataFrame = utilities.create_df_table(st.session_state.docs)
-    poi_df = apply_df_styles(poi_df)
-
-    with st.container(border=True):
-        st.subheader("AI Guide Results")
-        st.dataframe(poi_df, hide_index=True)
-
-    if st.session_state.summary:
-        render_accessible_summary_dark(st.session_state.summary)
+    # Results are rendered in the same run that produced them, no st.rerun() needed
+    render_results()
 
     if c5_button:
         tts: KokoroTTS = initialize_tts()
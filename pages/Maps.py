@@ -3,6 +3,7 @@
 import streamlit as st
 from streamlit_folium import st_folium
 import requests
+import orjson
 
 import folium
 
@@ -60,7 +61,7 @@ def add_route_to_map(
         # Add a timeout so the Streamlit app doesn't hang indefinitely if the API is down
         response = requests.get(url, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if data.get("code") == "Ok":
             # 1. Extract the route geometry
@@ -92,7 +93,7 @@ def add_route_to_map(
                 f"Could not calculate route: {data.get('message', 'Unknown routing error')}"
             )
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         # If the network call fails, show an error in the Streamlit UI instead of crashing
         st.error(
             "Failed to connect to the routing service. Showing straight-line distance instead."
@@ -108,6 +109,35 @@ def add_route_to_map(
         ).add_to(m)
 
 
+def get_poi_markers(docs: list) -> list[tuple[float, float, str]]:
+    """
+    Build (lat, lon, popup_html) for each POI once per result set.
+    Streamlit reruns this page on every interaction, so the markers are cached in
+    session state and rebuilt only when the docs list itself is replaced.
+    """
+    cached = st.session_state.get("poi_markers")
+    if cached and cached[0] is docs:
+        return cached[1]
+
+    markers: list[tuple[float, float, str]] = []
+    for d in docs:
+        maps_link: str = get_directions_url(
+            d.metadata["latitude"], d.metadata["longitude"]
+        )
+        popup_html = f"""
+        <div style="font-family: Arial; width: 200px;">
+            <b>{d.metadata['poi_name']}</b><br>
+            Distance: {d.metadata['distance_km']} km<br>
+            Accessibility: {d.metadata['wheelchair']}<br>
+            <a href='{maps_link}' target='_blank'>Get Directions</a>
+        </div>
+        """
+        markers.append((d.metadata["latitude"], d.metadata["longitude"], popup_html))
+
+    st.session_state.poi_markers = (docs, markers)
+    return markers
+
+
 poi_list: dict[str, tuple[float, float]] = {}
 
 
@@ -129,8 +159,11 @@ if st.session_state.docs:
         placeholder="Choose a POI...",
     )
 
+    # Canvas rendering keeps the route polyline cheap to draw
     m = folium.Map(
-        location=[st.session_state.user_lat, st.session_state.user_lon], zoom_start=15
+        location=[st.session_state.user_lat, st.session_state.user_lon],
+        zoom_start=15,
+        prefer_canvas=True,
     )
 
     if selected_poi_name:
@@ -147,25 +180,15 @@ if st.session_state.docs:
         icon=folium.Icon(color="blue", icon="user", prefix="fa"),
     ).add_to(m)
 
-    for d in st.session_state.docs:
-
-        maps_link: str = get_directions_url(
-            d.metadata["latitude"], d.metadata["longitude"]
-        )
-        popup_html = f"""
-        <div style="font-family: Arial; width: 200px;">
-            <b>{d.metadata['poi_name']}</b><br>
-            Distance: {d.metadata['distance_km']} km<br>
-            Accessibility: {d.metadata['wheelchair']}<br>
-            <a href='{maps_link}' target='_blank'>Get Directions</a>
-        </div>
-        """
-
+    # Group the POI markers so they are attached to the map in one step
+    poi_group = folium.FeatureGroup(name="Points of Interest")
+    for lat, lon, popup_html in get_poi_markers(st.session_state.docs):
         folium.Marker(
-            [d.metadata["latitude"], d.metadata["longitude"]],
+            [lat, lon],
             popup=folium.Popup(popup_html, max_width=250),
             icon=folium.Icon(color="orange", icon="location-dot", prefix="fa"),
-        ).add_to(m)
+        ).add_to(poi_group)
+    poi_group.add_to(m)
 
     # Display the map at the center
     st_folium(m, width="100%", height=1000, returned_objects=[])
@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from geopy.distance import great_circle
 from typing import TYPE_CHECKING, Optional, Dict, List, Any
 from pathlib import Path
 from datetime import datetime
+from math import cos, radians
 from numpy.linalg import norm
 import numpy as np
 import sqlite3
-import json
+import threading
+import orjson
+
+from geo import haversine_km
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -70,16 +73,26 @@ class QueryStorage:
         Row-based storage is used for optimal single-record retrieval.
         """
         self.db_path = Path(db_path)
-        self._create_table()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+        # One long-lived connection per instance, shared across Streamlit sessions.
+        # The lock serialises access since check_same_thread=False alone isn't thread-safe.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+
+        self._create_table()
 
     def _create_table(self) -> None:
         """
         Creates the cache table and indices for performance.
         """
-        with self._get_connection() as conn:
+        with self._lock:
+            conn = self._conn
             # Table for storing RAG results
             conn.execute(
                 """
@@ -99,7 +112,10 @@ class QueryStorage:
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_query ON cached_queries(query)"
             )
-            conn.commit()
+            # Indexing the cordinates lets the bounding box prefilter use a range scan
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_latlon ON cached_queries(lat, lon)"
+            )
 
     def find_nearby_query(
         self,
@@ -112,34 +128,61 @@ class QueryStorage:
     ) -> Optional[QueryRecord]:
         """
         Retrieves a cached result if the user is within the threshold distance.
+        Rows outside a bounding box around the user are filtered out in SQL before the
+        distance and similarity checks.
         """
 
-        user_loc = (lat, lon)
-
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM cached_queries")
+        # Bounding box around the user, so SQLite only returns rows that could be in range
+        dlat = threshold_meters / 111_000.0
+        dlon = threshold_meters / (111_000.0 * max(cos(radians(lat)), 1e-6))
+
+        # Split the longitude range in two when the box crosses the antimeridian,
+        # and skip it entirely when the box spans every longitude (near the poles)
+        lon_min, lon_max = lon - dlon, lon + dlon
+        if dlon >= 180:
+            lon_clause, lon_params = "1", ()
+        elif lon_min < -180:
+            lon_clause = "(lon >= ? OR lon <= ?)"
+            lon_params = (lon_min + 360, lon_max)
+        elif lon_max > 180:
+            lon_clause = "(lon >= ? OR lon <= ?)"
+            lon_params = (lon_min, lon_max - 360)
+        else:
+            lon_clause = "lon BETWEEN ? AND ?"
+            lon_params = (lon_min, lon_max)
+
+        with self._lock:
+            cursor = self._conn.execute(
+                f"SELECT * FROM cached_queries WHERE lat BETWEEN ? AND ? AND {lon_clause}",
+                (lat - dlat, lat + dlat, *lon_params),
+            )
             rows: List[Dict[str, Any]] = cursor.fetchall()
 
+        if not rows:
+            return None
+
+        # Filter by distance in a single vectorized pass before decoding any JSON
+        distances_km = haversine_km(
+            [row["lat"] for row in rows], [row["lon"] for row in rows], lat, lon
+        )
+        nearby_rows = [
+            row
+            for row, in_range in zip(rows, distances_km <= threshold_meters / 1000)
+            if in_range
+        ]
+
         best_record: Optional[QueryRecord] = None
         highest_score = -1
-        valid_results = []
-        for row in rows:
+        for row in nearby_rows:
             try:
                 raw_data = dict(row)
-                raw_data["table_data"] = json.loads(raw_data["table_data"])
+                raw_data["table_data"] = orjson.loads(raw_data["table_data"])
 
                 if raw_data["embedding"]:
-                    raw_data["embedding"] = json.loads(raw_data["embedding"])
+                    raw_data["embedding"] = orjson.loads(raw_data["embedding"])
 
                 record = QueryRecord.model_validate(raw_data)
 
-                stored_loc = (record.lat, record.lon)
-                distance = great_circle(user_loc, stored_loc).meters
-
-                if distance > threshold_meters:
-                    continue
-
                 score = cosine_similarity(user_embedding, record.embedding)
 
                 if score >= similarity_threshold and score > highest_score:
@@ -160,8 +203,8 @@ class QueryStorage:
         """
         Saves result to local storage, serializing the DataFrame to JSON.
         """
-        with self._get_connection() as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """
                 INSERT INTO cached_queries (query, lat, lon, summary, table_data, embedding, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
@@ -171,12 +214,11 @@ class QueryStorage:
                     record.lat,
                     record.lon,
                     record.summary,
-                    json.dumps(record.table_data),
-                    json.dumps(record.embedding),  # Serialize vector to JSON
+                    orjson.dumps(record.table_data).decode(),
+                    orjson.dumps(record.embedding).decode(),  # Serialize vector to JSON
                     record.timestamp.isoformat(),
                 ),
             )
-            conn.commit()
 
     def _delete_query_result(self, query_text: str, lat: float, lon: float) -> None:
         """
@@ -189,10 +231,9 @@ class QueryStorage:
         :param lon: The longitude of the location associated with the cache entry to delete.
         """
 
-        with self._get_connection() as conn:
-            conn.execute(
+        with self._lock:
+            self._conn.execute(
                 """DELETE FROM cached_queries 
                WHERE query = ? AND lat = ? AND lon = ?""",
                 (query_text, lat, lon),
             )
-            conn.commit()
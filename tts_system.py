@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from kokoro_onnx import Kokoro
-import soundfile as sf
+import numpy as np
 import requests
+import struct
 import os
 import io
 import re
@@ -23,6 +23,10 @@ class KokoroTTS:
         self.voices_path = "voices-v1.0.bin"
         
         self._ensure_models_exist()
+
+        # Deferred import, onnxruntime only loads when audio is first requested
+        from kokoro_onnx import Kokoro
+
         self.kokoro = Kokoro(self.model_path, self.voices_path)
 
     def _ensure_models_exist(self):
@@ -56,16 +60,17 @@ class KokoroTTS:
         if text is None or not isinstance(text, str) or text.strip() == "":
             return False, ""
 
-        # Normalize whitespace
-        text = " ".join(text.split())
-        text = self.CLEAN_REGEX.sub("", text)
+        # Strip unsupported characters and split into words once, the split also
+        # normalizes whitespace, then reuse the word list for the length check
+        words = self.CLEAN_REGEX.sub("", text).split()
 
-        if len(text.split()) > 250:
+        if len(words) > 250:
             print("Warning: Text exceeds 250 words. Truncating to fit model limits.")
-            text = " ".join(text.split()[:250])
-            end_space = text.rfind(" ")
-            if end_space > 0:
-                text = text[:end_space] + "..."
+            # Trim to the word limit and mark the cut
+            words = words[:249]
+            words[-1] += "..."
+
+        text = " ".join(words)
 
         return True, text
 
@@ -82,7 +87,29 @@ class KokoroTTS:
         )
 
         # Convert the samples to WAV format in memory
-        byte_io = io.BytesIO()
-        sf.write(byte_io, samples, sample_rate, format="WAV")
-        byte_io.seek(0)
-        return byte_io
\ No newline at end of file
+        return io.BytesIO(self._to_wav_bytes(samples, sample_rate))
+
+    @staticmethod
+    def _to_wav_bytes(samples: np.ndarray, sample_rate: int) -> bytes:
+        """
+        Encodes mono float samples as 16-bit PCM behind a hand-built 44-byte RIFF header.
+        Avoids a round trip through libsndfile.
+        """
+        pcm_data = (np.clip(samples, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + len(pcm_data),
+            b"WAVE",
+            b"fmt ",
+            16,  # fmt chunk size
+            1,  # PCM format
+            1,  # Mono
+            sample_rate,
+            sample_rate * 2,  # Byte rate
+            2,  # Block align
+            16,  # Bits per sample
+            b"data",
+            len(pcm_data),
+        )
+        return header + pcm_data
\ No newline at end of file
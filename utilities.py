@@ -24,23 +24,12 @@ class utilities:
         """
 
 
-        # Extract documents for data if available
-        meta_data = []
-        for doc in docs:
-            
-            try:
-                meta: dict = doc.metadata.copy() # Use copy to avoid modifying original metadata
-                # Only include metadata if it has valid latitude and longitude values
-                if "latitude" not in meta or "longitude" not in meta:
-                    meta["latitude"] = 0.0
-                    meta["longitude"] = 0.0
-                meta_data.append(meta)
-            except Exception as e:
-                meta_data.append({})
-        
-        meta_df = pd.DataFrame(meta_data) if meta_data else pd.DataFrame()
-            
-        return meta_df
+        # Single pass over the documents, defaulting missing cordinates to 0.0
+        meta_data = [
+            {"latitude": 0.0, "longitude": 0.0, **doc.metadata} for doc in docs
+        ]
+
+        return pd.DataFrame(meta_data) if meta_data else pd.DataFrame()
 
     @staticmethod
     def check_user_query(query: str) -> bool:
@@ -59,6 +48,38 @@ class utilities:
         return True
     
 
+    # Words ignored when comparing queries for follow-ups
+    STOP_WORDS: frozenset[str] = frozenset(
+        {
+            "the", "and", "for", "with", "near", "nearby", "about", "tell", "more",
+            "any", "are", "which", "what", "there", "that", "this", "show", "find",
+        }
+    )
+
+    @staticmethod
+    def is_followup_query(query: str, previous_query: str) -> bool:
+        """
+        Decides whether a query is a follow-up on the previous search.
+        ---
+        Logic:
+        1. Lowercase both queries and keep content words (longer than 2 characters, not stop words).
+        2. A repeat of the same query is not a follow-up, so it goes through the cache instead.
+        3. Return True only if every content word of the previous query appears in the new one,
+           so a new search that merely shares words (e.g. "wheelchair accessible") is not a follow-up.
+        """
+        if not previous_query or query.strip().lower() == previous_query.strip().lower():
+            return False
+
+        def content_words(text: str) -> set[str]:
+            return {
+                w
+                for w in text.lower().split()
+                if len(w) > 2 and w not in utilities.STOP_WORDS
+            }
+
+        previous_words = content_words(previous_query)
+        return bool(previous_words) and previous_words <= content_words(query)
+
     def check_user_cords(lat: float, lon: float) -> bool:
         if not isinstance(lat, float) or not isinstance(lon, float):
             return False
@@ -77,39 +98,32 @@ class utilities:
         :return: DataFrame created from the table data in the document's metadata
         :rtype: DataFrame
         """
-       # Extract documents for data if available
+        # Build each display row directly from the metadata, instead of copying it and popping keys
         meta_data = []
         for doc in docs:
+            meta: dict = doc.metadata
+
+            poi: str = meta.get("poi_name", "Unknown POI")
+            addr: str = meta.get("address", "Unknown Address")
+
+            wheelchair_acc: tuple = meta.get("wheelchair", ("Unknown", "Unknown"))
+            if isinstance(wheelchair_acc, (tuple, list)) and len(wheelchair_acc) == 2:
+                wheelchair_entrance, wheelchair_restroom = wheelchair_acc
+            else:
+                wheelchair_entrance, wheelchair_restroom = ("Unknown", "Unknown")
+
             try:
-                # Rearnge metadata for better presentation in the UI, and to ensure only relevant information is displayed.
-                meta: dict = doc.metadata.copy() # Use copy to avoid modifying original metadata
-                
-                meta.pop("latitude",0.0)
-                meta.pop("longitude",0.0)
-
-                poi: str = meta.pop("poi_name","Unknown POI")
-                addr: str = meta.pop("address","Unknown Address")
-                meta["Point of Interest"] = f"{poi} - {addr}"
-                
-                wheelchair_acc: tuple = meta.pop("wheelchair", ("Unknown", "Unknown"))
-                if isinstance(wheelchair_acc, (tuple,list)) and len(wheelchair_acc) == 2:
-                    wheelchair_entrance, wheelchair_restroom = wheelchair_acc
-                else:
-                    wheelchair_entrance, wheelchair_restroom = ("Unknown", "Unknown")
-                meta["Wheelchair Accessibility"] = f"Entrance: {wheelchair_entrance}, Restroom: {wheelchair_restroom}"
-
-                distance: float = float(meta.pop("distance_km", "Unknown"))
-                meta["Distance (km)"] = {distance}
-
-                meta_data.append(meta)
-                
-            except Exception as e:
-                print(f"Error extracting metadata from document: {e}")
-                meta_data.append({
-                    "Point of Interest": "Error processing record",
-                    "Wheelchair Accessibility": "Unknown",
-                    "Distance (km)": "Unknown"
-                })
-                
+                distance: float | str = float(meta.get("distance_km"))
+            except (TypeError, ValueError):
+                distance = "Unknown"
+
+            meta_data.append(
+                {
+                    "Point of Interest": f"{poi} - {addr}",
+                    "Wheelchair Accessibility": f"Entrance: {wheelchair_entrance}, Restroom: {wheelchair_restroom}",
+                    "Distance (km)": distance,
+                }
+            )
+
         return pd.DataFrame(meta_data) if meta_data else pd.DataFrame()
     
\ No newline at end of file